@@ -0,0 +1,27 @@
+-- Migration: Create expire_old_messages function
+-- Description: Expire stale queue messages server-side and return only the count
+-- Date: 2025-01-10
+
+CREATE OR REPLACE FUNCTION expire_old_messages(hours INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    expired_count INTEGER;
+BEGIN
+    WITH updated AS (
+        UPDATE message_queue
+        SET status = 'EXPIRED',
+            updated_at = NOW()
+        WHERE created_at < NOW() - make_interval(hours => hours)
+          AND status NOT IN ('DONE', 'EXPIRED', 'SKIPPED')
+        RETURNING 1
+    )
+    SELECT count(*) INTO expired_count FROM updated;
+
+    RETURN expired_count;
+END;
+$$;
+
+-- Add comment
+COMMENT ON FUNCTION expire_old_messages(INTEGER) IS 'Mark queue messages older than N hours as EXPIRED; returns number expired';
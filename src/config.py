@@ -20,6 +20,9 @@ class Settings(BaseSettings):
 
     # OpenAI Configuration (ChatGPT)
     openai_api_key: str
+    # Processing tier for workflow LLM calls ("priority" = lower latency where
+    # the account/model supports it; "default", "flex", "auto"). Unset = account default
+    openai_service_tier: str | None = None
 
     # GroupMe Configuration
     groupme_bot_id: str
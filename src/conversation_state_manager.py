@@ -4,12 +4,18 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from .config import settings
 from .models import ConversationMessage, Workflow, WorkflowStateData
 from .supabase_client import get_supabase
 
 logger = logging.getLogger(__name__)
 
+# List validators for multi-row query results
+_CONVERSATION_LIST_ADAPTER = TypeAdapter(list[ConversationMessage])
+_WORKFLOW_LIST_ADAPTER = TypeAdapter(list[Workflow])
+
 
 class ConversationStateManager:
     """
@@ -102,10 +108,7 @@ class ConversationStateManager:
             )
 
             # Reverse to get oldest-first order (for LLM context)
-            messages = [
-                ConversationMessage(**row)
-                for row in reversed(result.data)
-            ]
+            messages = _CONVERSATION_LIST_ADAPTER.validate_python(result.data[::-1])
 
             logger.info(f"Retrieved {len(messages)} recent messages")
             return messages
@@ -138,7 +141,7 @@ class ConversationStateManager:
                 .execute()
             )
 
-            messages = [ConversationMessage(**row) for row in result.data]
+            messages = _CONVERSATION_LIST_ADAPTER.validate_python(result.data)
 
             logger.info(f"Retrieved {len(messages)} messages for workflow")
             return messages
@@ -312,7 +315,7 @@ class ConversationStateManager:
                 .execute()
             )
 
-            workflows = [Workflow(**row) for row in result.data]
+            workflows = _WORKFLOW_LIST_ADAPTER.validate_python(result.data)
 
             if workflows:
                 logger.info(f"Found {len(workflows)} active workflow(s) for squad {squad_id}")
@@ -502,7 +505,7 @@ class ConversationStateManager:
                 .execute()
             )
 
-            workflows = [Workflow(**row) for row in result.data]
+            workflows = _WORKFLOW_LIST_ADAPTER.validate_python(result.data)
 
             logger.info(f"Restored {len(workflows)} active workflow(s)")
 
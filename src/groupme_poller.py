@@ -11,6 +11,7 @@ from typing import Any
 from .admin_notifier import notify_admin
 from .agentic_coordinator import AgenticCoordinator
 from .config import settings
+from .logging_config import flush_logs
 from .message_queue_manager import MessageQueueManager
 from .models import GroupMeMessage
 from .poller_lock import PollerLock
@@ -482,6 +483,9 @@ class GroupMePoller:
             # Always release the lock
             self.poller_lock.release()
 
+            # Write out this cycle's buffered log records
+            flush_logs()
+
     def reset_state(self) -> None:
         """
         Reset the poller state by deleting the last message ID.
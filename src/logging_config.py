@@ -1,11 +1,81 @@
 """Logging configuration for the Station 95 chatbot."""
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 
 from .config import settings
 
+# Number of records buffered per file handler before flushing to disk
+LOG_BUFFER_CAPACITY = 256
+
+# Loggers that own buffered file handlers (root plus the dedicated logs)
+BUFFERED_LOGGERS = ("", "llm", "groupme", "calendar")
+
+# Chatty third-party loggers limited to WARNING and above
+NOISY_LOGGERS = (
+    "httpx",
+    "httpcore",
+    "hpack",
+    "openai",
+    "urllib3",
+    "supabase",
+    "postgrest",
+)
+
+
+def _buffered(file_handler: logging.FileHandler) -> logging.Handler:
+    """
+    Wrap a file handler so records are flushed to disk in batches.
+
+    Records are held in memory until the buffer fills, an ERROR-level
+    record arrives, or flush_logs() is called (at the end of every poll
+    cycle), at which point the whole batch is written at once.
+
+    Args:
+        file_handler: Configured file handler to write batches to
+
+    Returns:
+        Buffering handler that forwards to the file handler
+    """
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    memory_handler.setLevel(file_handler.level)
+    return memory_handler
+
+
+def flush_logs() -> None:
+    """
+    Write all buffered log records to disk.
+
+    Called at the end of each poll cycle so INFO/WARNING records are not
+    held in memory indefinitely (and lost if the process is killed).
+    """
+    for name in BUFFERED_LOGGERS:
+        for handler in logging.getLogger(name).handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                handler.flush()
+
+
+def _quiet(name: str) -> None:
+    """
+    Limit a third-party logger to WARNING and above.
+
+    The level is set on the library's own logger so INFO/DEBUG calls are
+    rejected by its isEnabledFor() check before a record is created.
+    Propagation is kept so warnings still reach the root handlers.
+
+    Args:
+        name: Logger name
+    """
+    lib_logger = logging.getLogger(name)
+    lib_logger.setLevel(logging.WARNING)
+
 
 def setup_logging() -> None:
     """Configure logging for the application."""
@@ -26,27 +96,27 @@ def setup_logging() -> None:
     )
 
     # File handler for all logs
-    file_handler = logging.FileHandler(log_dir / "chatbot.log")
+    file_handler = logging.FileHandler(log_dir / "chatbot.log", delay=True)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
 
     # File handler for errors only
-    error_handler = logging.FileHandler(log_dir / "errors.log")
+    error_handler = logging.FileHandler(log_dir / "errors.log", delay=True)
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
 
     # File handler for LLM interactions
-    llm_handler = logging.FileHandler(log_dir / "llm.log")
+    llm_handler = logging.FileHandler(log_dir / "llm.log", delay=True)
     llm_handler.setLevel(logging.INFO)
     llm_handler.setFormatter(detailed_formatter)
 
     # File handler for GroupMe communications
-    groupme_handler = logging.FileHandler(log_dir / "groupme.log")
+    groupme_handler = logging.FileHandler(log_dir / "groupme.log", delay=True)
     groupme_handler.setLevel(logging.INFO)
     groupme_handler.setFormatter(detailed_formatter)
 
     # File handler for Calendar service communications
-    calendar_handler = logging.FileHandler(log_dir / "calendar.log")
+    calendar_handler = logging.FileHandler(log_dir / "calendar.log", delay=True)
     calendar_handler.setLevel(logging.INFO)
     calendar_handler.setFormatter(detailed_formatter)
 
@@ -63,35 +133,30 @@ def setup_logging() -> None:
     root_logger.handlers.clear()
 
     # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
+    root_logger.addHandler(_buffered(file_handler))
+    root_logger.addHandler(_buffered(error_handler))
     root_logger.addHandler(console_handler)
 
     # Configure LLM logger with its own handler
     llm_logger = logging.getLogger("llm")
     llm_logger.setLevel(logging.INFO)
-    llm_logger.addHandler(llm_handler)
+    llm_logger.addHandler(_buffered(llm_handler))
     llm_logger.propagate = False  # Don't propagate to root logger
 
     # Configure GroupMe logger with its own handler
     groupme_logger = logging.getLogger("groupme")
     groupme_logger.setLevel(logging.INFO)
-    groupme_logger.addHandler(groupme_handler)
+    groupme_logger.addHandler(_buffered(groupme_handler))
     groupme_logger.propagate = False  # Don't propagate to root logger
 
     # Configure Calendar logger with its own handler
     calendar_logger = logging.getLogger("calendar")
     calendar_logger.setLevel(logging.INFO)
-    calendar_logger.addHandler(calendar_handler)
+    calendar_logger.addHandler(_buffered(calendar_handler))
     calendar_logger.propagate = False  # Don't propagate to root logger
 
     # Reduce noise from third-party libraries
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("hpack").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("supabase").setLevel(logging.WARNING)
-    logging.getLogger("postgrest").setLevel(logging.WARNING)
+    for name in NOISY_LOGGERS:
+        _quiet(name)
 
     logging.info("Logging configured successfully")
@@ -1,9 +1,10 @@
 """Message queue manager for robust message processing."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
+from pydantic import TypeAdapter
 from supabase import Client
 
 from .config import settings
@@ -11,6 +12,9 @@ from .models import MessageQueue
 
 logger = logging.getLogger(__name__)
 
+# Built once so batch reads reuse a single compiled validator
+_MQ_LIST_ADAPTER = TypeAdapter(list[MessageQueue])
+
 
 class MessageQueueManager:
     """Manages message queue operations in Supabase."""
@@ -61,13 +65,13 @@ class MessageQueueManager:
             result = self.supabase.table("message_queue").insert(data).execute()
 
             if result.data:
-                logger.debug(f"Inserted message {message_id} into queue")
+                logger.debug("Inserted message %s into queue", message_id)
                 return MessageQueue(**result.data[0])
             else:
                 raise Exception("No data returned from insert")
 
         except Exception as e:
-            logger.error(f"Failed to insert message into queue: {e}")
+            logger.error("Failed to insert message into queue: %s", e)
             # Don't raise - we want to continue polling even if queue insert fails
             return None
 
@@ -88,11 +92,11 @@ class MessageQueueManager:
             )
 
             if result.data:
-                return [MessageQueue(**msg) for msg in result.data]
+                return _MQ_LIST_ADAPTER.validate_python(result.data)
             return []
 
         except Exception as e:
-            logger.error(f"Failed to get pending messages: {e}")
+            logger.error("Failed to get pending messages: %s", e)
             return []
 
     def update_status(
@@ -110,13 +114,14 @@ class MessageQueueManager:
             error_message: Optional error message for FAILED status
         """
         try:
+            iso_now = datetime.now().isoformat()
             data = {
                 "status": status,
-                "updated_at": datetime.now().isoformat(),
+                "updated_at": iso_now,
             }
 
             if status == "DONE":
-                data["processed_at"] = datetime.now().isoformat()
+                data["processed_at"] = iso_now
 
             if status == "FAILED":
                 data["error_message"] = error_message
@@ -135,36 +140,34 @@ class MessageQueueManager:
                 "message_id", message_id
             ).execute()
 
-            logger.debug(f"Updated message {message_id} status to {status}")
+            logger.debug("Updated message %s status to %s", message_id, status)
 
         except Exception as e:
-            logger.error(f"Failed to update message status: {e}")
+            logger.error("Failed to update message status: %s", e)
 
     def expire_old_messages(self) -> int:
         """
         Soft delete messages older than configured expiry time.
 
+        Runs server-side via the expire_old_messages() database function
+        (migration 003) so only the count crosses the wire.
+
         Returns:
             Number of messages expired
         """
         try:
-            expiry_time = datetime.now() - timedelta(hours=settings.message_expiry_hours)
-
-            result = (
-                self.supabase.table("message_queue")
-                .update({"status": "EXPIRED", "updated_at": datetime.now().isoformat()})
-                .lt("created_at", expiry_time.isoformat())
-                .not_.in_("status", ["DONE", "EXPIRED", "SKIPPED"])
-                .execute()
-            )
+            result = self.supabase.rpc(
+                "expire_old_messages",
+                {"hours": settings.message_expiry_hours}
+            ).execute()
 
-            count = len(result.data) if result.data else 0
+            count = result.data or 0
             if count > 0:
-                logger.info(f"Expired {count} old messages")
+                logger.info("Expired %s old messages", count)
             return count
 
         except Exception as e:
-            logger.error(f"Failed to expire old messages: {e}")
+            logger.error("Failed to expire old messages: %s", e)
             return 0
 
     def get_message_by_id(self, message_id: str) -> MessageQueue | None:
@@ -190,7 +193,7 @@ class MessageQueueManager:
             return None
 
         except Exception as e:
-            logger.error(f"Failed to get message by ID: {e}")
+            logger.error("Failed to get message by ID: %s", e)
             return None
 
     def get_retry_count(self, message_id: str) -> int:
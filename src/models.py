@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # =============================================================================
@@ -14,12 +14,28 @@ class CalendarCommand(BaseModel):
     """Represents a command to send to the calendar service."""
 
     action: Literal["noCrew", "addShift", "obliterateShift"]
-    date: str = Field(pattern=r"^\d{8}$", description="Date in YYYYMMDD format")
-    shift_start: str = Field(pattern=r"^\d{4}$", description="Start time in HHMM format")
-    shift_end: str = Field(pattern=r"^\d{4}$", description="End time in HHMM format")
+    date: str = Field(description="Date in YYYYMMDD format")
+    shift_start: str = Field(description="Start time in HHMM format")
+    shift_end: str = Field(description="End time in HHMM format")
     squad: Literal[34, 35, 42, 43, 54]
     preview: bool = False  # Preview mode flag
 
+    @field_validator("date")
+    @classmethod
+    def _validate_date(cls, v: str) -> str:
+        """Require an 8-digit YYYYMMDD string."""
+        if len(v) != 8 or not (v.isascii() and v.isdigit()):
+            raise ValueError("date must be 8 digits (YYYYMMDD)")
+        return v
+
+    @field_validator("shift_start", "shift_end")
+    @classmethod
+    def _validate_time(cls, v: str) -> str:
+        """Require a 4-digit HHMM string."""
+        if len(v) != 4 or not (v.isascii() and v.isdigit()):
+            raise ValueError("time must be 4 digits (HHMM)")
+        return v
+
     def to_query_params(self) -> dict[str, str]:
         """Convert to query parameters for HTTP request."""
         return {
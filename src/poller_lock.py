@@ -2,8 +2,9 @@
 
 import json
 import logging
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 from .config import settings
@@ -35,78 +36,68 @@ class PollerLock:
         Raises:
             Exception: If stale lock detected (notifies admin)
         """
-        # Check if lock exists
-        if self.lock_file.exists():
-            try:
-                lock_data = json.loads(self.lock_file.read_text())
-                started_at = datetime.fromisoformat(lock_data["started_at"])
-
-                # Check if stale (older than configured timeout)
-                age = datetime.now() - started_at
-                timeout = timedelta(minutes=settings.poller_timeout_minutes)
-
-                if age > timeout:
-                    logger.warning(
-                        f"Stale poller lock detected (age: {age.total_seconds():.0f}s), "
-                        f"overriding"
-                    )
-                    # Import here to avoid circular dependency
-                    from .admin_notifier import notify_admin
-                    notify_admin(
-                        "poller_timeout",
-                        {
-                            "started_at": started_at.isoformat(),
-                            "age_seconds": age.total_seconds(),
-                            "instance_id": lock_data.get("poller_instance_id"),
-                        }
-                    )
-                    # Override stale lock
-                    self._create_lock()
-                    return True
-                else:
-                    logger.info(
-                        f"Active poller detected (age: {age.total_seconds():.0f}s), "
-                        f"yielding"
-                    )
-                    return False
-
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.error(f"Invalid lock file format: {e}, overriding")
+        # Check if lock exists - its mtime is the lock creation time
+        try:
+            lock_mtime = self.lock_file.stat().st_mtime
+        except FileNotFoundError:
+            lock_mtime = None
+
+        if lock_mtime is not None:
+            # Check if stale (older than configured timeout)
+            age_seconds = time.time() - lock_mtime
+            timeout_seconds = settings.poller_timeout_minutes * 60
+
+            if age_seconds > timeout_seconds:
+                logger.warning(
+                    "Stale poller lock detected (age: %.0fs), overriding", age_seconds
+                )
+                # Import here to avoid circular dependency
+                from .admin_notifier import notify_admin
+                notify_admin(
+                    "poller_timeout",
+                    {
+                        "started_at": datetime.fromtimestamp(lock_mtime).isoformat(),
+                        "age_seconds": age_seconds,
+                        "instance_id": self._read_lock_instance_id(),
+                    }
+                )
+                # Override stale lock
                 self._create_lock()
                 return True
 
+            logger.info("Active poller detected (age: %.0fs), yielding", age_seconds)
+            return False
+
         # No lock exists, create it
         self._create_lock()
         return True
 
+    def _read_lock_instance_id(self) -> str | None:
+        """Read the owning instance ID from the lock file (None if unreadable)."""
+        try:
+            lock_data = json.loads(self.lock_file.read_text())
+            return lock_data.get("poller_instance_id")
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.error("Invalid lock file format: %s", e)
+            return None
+
     def _create_lock(self) -> None:
         """Create the lock file with current timestamp."""
         lock_data = {
             "poller_instance_id": self.instance_id,
             "started_at": datetime.now().isoformat(),
-            "last_heartbeat": datetime.now().isoformat(),
         }
         self.lock_file.write_text(json.dumps(lock_data, indent=2))
-        logger.debug(f"Created poller lock: {self.instance_id}")
-
-    def update_heartbeat(self) -> None:
-        """Update the heartbeat timestamp in the lock file."""
-        if self.lock_file.exists():
-            try:
-                lock_data = json.loads(self.lock_file.read_text())
-                lock_data["last_heartbeat"] = datetime.now().isoformat()
-                self.lock_file.write_text(json.dumps(lock_data, indent=2))
-            except Exception as e:
-                logger.warning(f"Failed to update heartbeat: {e}")
+        logger.debug("Created poller lock: %s", self.instance_id)
 
     def release(self) -> None:
         """Release the poller lock by deleting the lock file."""
         if self.lock_file.exists():
             try:
                 self.lock_file.unlink()
-                logger.debug(f"Released poller lock: {self.instance_id}")
+                logger.debug("Released poller lock: %s", self.instance_id)
             except Exception as e:
-                logger.error(f"Failed to release lock: {e}")
+                logger.error("Failed to release lock: %s", e)
 
     def __enter__(self):
         """Context manager entry."""
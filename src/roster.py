@@ -1,8 +1,9 @@
 """Roster management for squad members."""
 
-import json
 from typing import Literal
-from pydantic import BaseModel
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
 
 
 class Member(BaseModel):
@@ -14,6 +15,9 @@ class Member(BaseModel):
     groupme_name: str
 
 
+_MEMBER_LIST_ADAPTER = TypeAdapter(list[Member])
+
+
 class Roster:
     """Manages the roster of squad members."""
 
@@ -21,26 +25,30 @@ class Roster:
         """Initialize the roster from a JSON file."""
         self.roster_file_path = roster_file_path
         self.members: list[Member] = []
+        self._by_name: dict[str, Member] = {}
         self._load_roster()
 
     def _load_roster(self) -> None:
         """Load roster from JSON file."""
         try:
-            with open(self.roster_file_path, "r") as f:
-                data = json.load(f)
-                self.members = [Member(**member) for member in data["members"]]
+            with open(self.roster_file_path, "rb") as f:
+                data = orjson.loads(f.read())
+            self.members = _MEMBER_LIST_ADAPTER.validate_python(data["members"])
+            self._build_name_index()
         except FileNotFoundError:
             raise FileNotFoundError(f"Roster file not found: {self.roster_file_path}")
         except Exception as e:
             raise Exception(f"Error loading roster: {e}")
 
+    def _build_name_index(self) -> None:
+        """Index members by lower-cased GroupMe name (first entry wins)."""
+        self._by_name = {}
+        for member in self.members:
+            self._by_name.setdefault(member.groupme_name.lower(), member)
+
     def find_member_by_name(self, name: str) -> Member | None:
         """Find a member by their GroupMe name (case-insensitive)."""
-        name_lower = name.lower()
-        for member in self.members:
-            if member.groupme_name.lower() == name_lower:
-                return member
-        return None
+        return self._by_name.get(name.lower())
 
     def is_authorized(self, name: str) -> bool:
         """Check if a person is in the roster."""
@@ -3,6 +3,8 @@
 import logging
 from typing import Any
 
+import orjson
+
 from langchain_core.messages import (
     HumanMessage,
     AIMessage,
@@ -34,6 +36,13 @@ def serialize_state(state: dict) -> dict:
             _serialize_message(msg) for msg in serialized["messages"]
         ]
 
+    # Store the schedule in compact form when it round-trips losslessly
+    if serialized.get("schedule_state"):
+        packed = _pack_schedule_state(serialized["schedule_state"])
+        if packed is not None:
+            del serialized["schedule_state"]
+            serialized["packed_schedule"] = packed
+
     return serialized
 
 
@@ -57,9 +66,173 @@ def deserialize_state(state: dict) -> dict:
             _deserialize_message(msg_dict) for msg_dict in deserialized["messages"]
         ]
 
+    # Expand a compact schedule back to the calendar service format
+    packed = deserialized.pop("packed_schedule", None)
+    if packed is not None:
+        deserialized["schedule_state"] = _unpack_schedule_state(packed)
+
     return deserialized
 
 
+def pack_schedule(schedule: dict) -> list:
+    """
+    Pack a calendar day schedule into nested positional lists.
+
+    Layout (times are minutes since midnight, active is 0/1):
+        [day, [[name, start, end, tango, [[start, end, [[id, territories, active], ...]], ...]], ...]]
+
+    Args:
+        schedule: Day schedule ({"day": ..., "shifts": [...]})
+
+    Returns:
+        Packed schedule
+
+    Raises:
+        KeyError, TypeError, ValueError: If the schedule has an unexpected shape
+    """
+    return [
+        schedule["day"],
+        [
+            [
+                shift["name"],
+                _hhmm_to_minutes(shift["start_time"]),
+                _hhmm_to_minutes(shift["end_time"]),
+                shift["tango"],
+                [
+                    [
+                        _hhmm_to_minutes(segment["start_time"]),
+                        _hhmm_to_minutes(segment["end_time"]),
+                        [
+                            [squad["id"], squad["territories"], int(squad["active"])]
+                            for squad in segment["squads"]
+                        ],
+                    ]
+                    for segment in shift["segments"]
+                ],
+            ]
+            for shift in schedule["shifts"]
+        ],
+    ]
+
+
+def unpack_schedule(packed: list) -> dict:
+    """
+    Expand a schedule produced by pack_schedule.
+
+    Args:
+        packed: Packed schedule
+
+    Returns:
+        Day schedule in the calendar service format
+    """
+    day, shifts = packed
+    return {
+        "day": day,
+        "shifts": [
+            {
+                "name": name,
+                "start_time": _minutes_to_hhmm(start),
+                "end_time": _minutes_to_hhmm(end),
+                "segments": [
+                    {
+                        "start_time": _minutes_to_hhmm(seg_start),
+                        "end_time": _minutes_to_hhmm(seg_end),
+                        "squads": [
+                            {"id": squad_id, "territories": territories, "active": bool(active)}
+                            for squad_id, territories, active in squads
+                        ],
+                    }
+                    for seg_start, seg_end, squads in segments
+                ],
+                "tango": tango,
+            }
+            for name, start, end, tango, segments in shifts
+        ],
+    }
+
+
+def _pack_schedule_state(schedule_state: dict) -> dict | None:
+    """
+    Pack the schedule inside a schedule_state response.
+
+    Handles the schedule either as a "schedule" dict or as a
+    "day_schedule" JSON string. Other response fields are kept as-is.
+
+    Args:
+        schedule_state: Calendar service response stored in workflow state
+
+    Returns:
+        Packed representation, or None if the schedule does not round-trip
+        exactly (the caller then stores the original). A day_schedule
+        string must round-trip to the same parsed structure; it is
+        re-encoded compactly on unpack.
+    """
+    if not isinstance(schedule_state, dict):
+        return None
+
+    try:
+        if isinstance(schedule_state.get("schedule"), dict):
+            source_key = "schedule"
+            schedule = schedule_state["schedule"]
+        elif isinstance(schedule_state.get("day_schedule"), str):
+            source_key = "day_schedule"
+            schedule = orjson.loads(schedule_state["day_schedule"])
+        else:
+            return None
+
+        packed = pack_schedule(schedule)
+        if not _same_structure(unpack_schedule(packed), schedule):
+            return None
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+    # Keep the other fields (and key order) with a placeholder for the schedule
+    return {
+        "key": source_key,
+        "meta": {**schedule_state, source_key: None},
+        "schedule": packed,
+    }
+
+
+def _unpack_schedule_state(packed: dict) -> dict:
+    """
+    Rebuild a schedule_state response packed by _pack_schedule_state.
+
+    Args:
+        packed: Packed representation
+
+    Returns:
+        schedule_state in the calendar service response format
+    """
+    schedule = unpack_schedule(packed["schedule"])
+    if packed["key"] == "day_schedule":
+        schedule = orjson.dumps(schedule).decode()
+
+    schedule_state = dict(packed["meta"])
+    schedule_state[packed["key"]] = schedule
+    return schedule_state
+
+
+def _same_structure(a: Any, b: Any) -> bool:
+    """
+    Compare two JSON-compatible values, ignoring key order.
+
+    Unlike ==, this is type-strict, so True and 1 are not equal.
+    """
+    return orjson.dumps(a, option=orjson.OPT_SORT_KEYS) == orjson.dumps(b, option=orjson.OPT_SORT_KEYS)
+
+
+def _hhmm_to_minutes(value: str) -> int:
+    """Convert "HH:MM" to minutes since midnight."""
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _minutes_to_hhmm(value: int) -> str:
+    """Convert minutes since midnight to "HH:MM"."""
+    return f"{value // 60:02d}:{value % 60:02d}"
+
+
 def _serialize_message(msg: BaseMessage) -> dict:
     """
     Serialize a LangChain message to a dictionary.
@@ -107,35 +280,30 @@ def _deserialize_message(msg_dict: dict) -> BaseMessage:
 
     msg_type = msg_dict.get("type", "HumanMessage")
     content = msg_dict.get("content", "")
-    additional_kwargs = msg_dict.get("additional_kwargs", {})
-
-    # Map type name to class
-    message_classes = {
-        "HumanMessage": HumanMessage,
-        "AIMessage": AIMessage,
-        "SystemMessage": SystemMessage,
-        "ToolMessage": ToolMessage,
-    }
-
-    message_class = message_classes.get(msg_type, HumanMessage)
 
-    # ToolMessage requires tool_call_id
-    if msg_type == "ToolMessage":
-        tool_call_id = msg_dict.get("tool_call_id", "")
-        return ToolMessage(
-            content=content,
-            tool_call_id=tool_call_id,
-            additional_kwargs=additional_kwargs
-        )
-
-    # AIMessage may have tool_calls
-    if msg_type == "AIMessage":
-        tool_calls = msg_dict.get("tool_calls", [])
-        return AIMessage(
-            content=content,
-            additional_kwargs=additional_kwargs,
-            tool_calls=tool_calls
-        )
-
-    # All other message types
-    return message_class(content=content, additional_kwargs=additional_kwargs)
+    match msg_type:
+        case "ToolMessage":
+            # ToolMessage requires tool_call_id
+            return ToolMessage(
+                content=content,
+                tool_call_id=msg_dict.get("tool_call_id", ""),
+                additional_kwargs=msg_dict.get("additional_kwargs", {})
+            )
+        case "AIMessage":
+            # AIMessage may have tool_calls
+            return AIMessage(
+                content=content,
+                additional_kwargs=msg_dict.get("additional_kwargs", {}),
+                tool_calls=msg_dict.get("tool_calls", [])
+            )
+        case "SystemMessage":
+            return SystemMessage(
+                content=content,
+                additional_kwargs=msg_dict.get("additional_kwargs", {})
+            )
+        case _:
+            # HumanMessage and any unknown types
+            return HumanMessage(
+                content=content,
+                additional_kwargs=msg_dict.get("additional_kwargs", {})
+            )
@@ -1,7 +1,8 @@
 """LangChain tools for the agentic AI workflow."""
 
 import logging
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
 from typing import Annotated
 
 from langchain_core.tools import tool
@@ -14,6 +15,49 @@ logger = logging.getLogger(__name__)
 # Initialize calendar client
 calendar_client = CalendarClient()
 
+# Map day names to weekday numbers (Monday=0, Sunday=6)
+_DAY_MAP = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
+
+# Every keyword parse_time_reference looks for, found in a single pass.
+# Substring match (no word boundaries) so "tonight", "saturdays" etc. still match
+_TIME_KEYWORD_RE = re.compile("|".join(("tomorrow", "morning", "evening", "night", *_DAY_MAP)))
+
+
+def _yyyymmdd(dt: datetime) -> str:
+    """Format a date as YYYYMMDD without going through strftime."""
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+
+
+# Schedule index: {date: {(shift_start, shift_end): [shift, ...]}}
+ScheduleIndex = dict[str, dict[tuple[str, str], list[dict]]]
+
+
+def _index_schedule(schedule: dict) -> ScheduleIndex:
+    """
+    Index a calendar schedule response by date and shift times.
+
+    Args:
+        schedule: Schedule response from the calendar service
+
+    Returns:
+        Nested dict mapping date -> (shift_start, shift_end) -> shifts
+    """
+    index: ScheduleIndex = {}
+    for date_entry in schedule.get("dates", []):
+        shifts_by_time = index.setdefault(date_entry.get("date"), {})
+        for shift in date_entry.get("shifts", []):
+            key = (shift.get("shift_start"), shift.get("shift_end"))
+            shifts_by_time.setdefault(key, []).append(shift)
+    return index
+
 
 @tool
 def get_schedule(
@@ -33,11 +77,11 @@ def get_schedule(
     Returns:
         Dictionary with schedule data containing dates and shifts
     """
-    logger.info(f"🔍 Tool: get_schedule({start_date}, {end_date}, squad={squad})")
+    logger.debug("🔍 Tool: get_schedule(%s, %s, squad=%s)", start_date, end_date, squad)
 
     try:
         schedule = calendar_client.get_schedule(start_date, end_date, squad)
-        logger.info(f"✅ Schedule fetched successfully")
+        logger.debug("✅ Schedule fetched successfully")
         return schedule
     except Exception as e:
         error_msg = f"Failed to fetch schedule: {str(e)}"
@@ -64,30 +108,25 @@ def check_squad_scheduled(
     Returns:
         True if the squad is scheduled for this shift, False otherwise
     """
-    logger.info(f"✅ Tool: check_squad_scheduled(squad={squad}, date={date}, {shift_start}-{shift_end})")
+    logger.debug(
+        "✅ Tool: check_squad_scheduled(squad=%s, date=%s, %s-%s)",
+        squad, date, shift_start, shift_end
+    )
 
     try:
-        schedule = calendar_client.get_schedule(date, date, squad)
-
-        # Parse the schedule to check if this specific shift exists
-        # Note: The actual structure depends on your calendar API response
-        # This is a sample implementation - adjust based on your API
-        if "dates" in schedule:
-            for date_entry in schedule["dates"]:
-                if date_entry.get("date") == date:
-                    for shift in date_entry.get("shifts", []):
-                        if (shift.get("squad") == squad and
-                            shift.get("shift_start") == shift_start and
-                            shift.get("shift_end") == shift_end and
-                            shift.get("crew_status") == "available"):
-                            logger.info(f"✅ Squad {squad} IS scheduled")
-                            return True
-
-        logger.info(f"❌ Squad {squad} is NOT scheduled")
+        index = _index_schedule(calendar_client.get_schedule(date, date, squad))
+        shifts = index.get(date, {}).get((shift_start, shift_end), [])
+
+        for shift in shifts:
+            if shift.get("squad") == squad and shift.get("crew_status") == "available":
+                logger.debug("✅ Squad %s IS scheduled", squad)
+                return True
+
+        logger.debug("❌ Squad %s is NOT scheduled", squad)
         return False
 
     except Exception as e:
-        logger.error(f"Error checking squad schedule: {e}")
+        logger.error("Error checking squad schedule: %s", e)
         return False
 
 
@@ -111,31 +150,26 @@ def count_active_crews(
     Returns:
         Number of active crews during this time period
     """
-    logger.info(
-        f"🔢 Tool: count_active_crews(date={date}, {shift_start}-{shift_end}, "
-        f"excluding={excluding_squad})"
+    logger.debug(
+        "🔢 Tool: count_active_crews(date=%s, %s-%s, excluding=%s)",
+        date, shift_start, shift_end, excluding_squad
     )
 
     try:
-        schedule = calendar_client.get_schedule(date, date)
-
-        count = 0
-        if "dates" in schedule:
-            for date_entry in schedule["dates"]:
-                if date_entry.get("date") == date:
-                    for shift in date_entry.get("shifts", []):
-                        # Check if shift overlaps with requested time period
-                        if (shift.get("shift_start") == shift_start and
-                            shift.get("shift_end") == shift_end and
-                            shift.get("crew_status") == "available" and
-                            shift.get("squad") != excluding_squad):
-                            count += 1
-
-        logger.info(f"✅ Count: {count} active crews")
+        index = _index_schedule(calendar_client.get_schedule(date, date))
+        shifts = index.get(date, {}).get((shift_start, shift_end), [])
+
+        count = sum(
+            1 for shift in shifts
+            if shift.get("crew_status") == "available"
+            and shift.get("squad") != excluding_squad
+        )
+
+        logger.debug("✅ Count: %d active crews", count)
         return count
 
     except Exception as e:
-        logger.error(f"Error counting active crews: {e}")
+        logger.error("Error counting active crews: %s", e)
         return 0
 
 
@@ -154,11 +188,11 @@ def parse_time_reference(
     Returns:
         Dictionary with parsed date, shift_start, and shift_end
     """
-    logger.info(f"📅 Tool: parse_time_reference('{time_reference}', {current_timestamp})")
+    logger.debug("📅 Tool: parse_time_reference('%s', %s)", time_reference, current_timestamp)
 
     # Convert timestamp to datetime
     current_time = datetime.fromtimestamp(current_timestamp)
-    current_date = current_time.strftime("%Y%m%d")
+    current_date = _yyyymmdd(current_time)
 
     # Simple parsing logic (can be enhanced)
     result = {
@@ -167,53 +201,39 @@ def parse_time_reference(
         "shift_end": "0600"
     }
 
-    time_ref_lower = time_reference.lower()
+    keywords = _TIME_KEYWORD_RE.findall(time_reference.lower())
+    found = frozenset(keywords)
 
-    if "morning" in time_ref_lower:
+    if "morning" in found:
         result["shift_start"] = "0600"
         result["shift_end"] = "1800"
-    elif "evening" in time_ref_lower or "night" in time_ref_lower:
+    elif "evening" in found or "night" in found:
         result["shift_start"] = "1800"
         result["shift_end"] = "0600"
 
     # Handle day references
-    from datetime import timedelta
-
-    if "tomorrow" in time_ref_lower:
+    if "tomorrow" in found:
         next_day = current_time + timedelta(days=1)
-        result["date"] = next_day.strftime("%Y%m%d")
+        result["date"] = _yyyymmdd(next_day)
     else:
-        # Map day names to weekday numbers (Monday=0, Sunday=6)
-        day_mapping = {
-            "monday": 0,
-            "tuesday": 1,
-            "wednesday": 2,
-            "thursday": 3,
-            "friday": 4,
-            "saturday": 5,
-            "sunday": 6
-        }
-
-        # Check if any day name is in the reference
-        for day_name, target_weekday in day_mapping.items():
-            if day_name in time_ref_lower:
-                current_weekday = current_time.weekday()
-
-                # Calculate days until target weekday
-                days_until = (target_weekday - current_weekday) % 7
-
-                # If it's 0 and we're past noon, assume next week
-                if days_until == 0 and current_time.hour >= 12:
-                    days_until = 7
-                # If it's 0 and we're before noon, use today
-                elif days_until == 0:
-                    days_until = 0
-
-                target_date = current_time + timedelta(days=days_until)
-                result["date"] = target_date.strftime("%Y%m%d")
-                break
-
-    logger.info(f"✅ Parsed: {result}")
+        # Find the first day name mentioned in the reference
+        day_name = next((k for k in keywords if k in _DAY_MAP), None)
+        if day_name:
+            target_weekday = _DAY_MAP[day_name]
+            current_weekday = current_time.weekday()
+
+            # Calculate days until target weekday
+            days_until = (target_weekday - current_weekday) % 7
+
+            # If it's 0 and we're past noon, assume next week
+            # (before noon, 0 means today)
+            if days_until == 0 and current_time.hour >= 12:
+                days_until = 7
+
+            target_date = current_time + timedelta(days=days_until)
+            result["date"] = _yyyymmdd(target_date)
+
+    logger.debug("✅ Parsed: %s", result)
     return result
 
 
@@ -3,14 +3,14 @@
 import logging
 from datetime import datetime
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
 
 from .calendar_client import CalendarClient
 from .conversation_state_manager import ConversationStateManager
 from .groupme_client import GroupMeClient
 from .models import CalendarCommand, ConversationMessage, Workflow, WorkflowStateData
 from .state_serializer import serialize_state, deserialize_state
-from .workflows import create_shift_workflow
+from .workflows import get_shift_workflow, parse_clarification_answer
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +46,8 @@ class WorkflowManager:
         self.calendar_client = calendar_client
         self.groupme_client = groupme_client
 
-        # Create the workflow graph (compiled LangGraph)
-        self.workflow_graph = create_shift_workflow()
+        # Compiled LangGraph (built once per process; safe to share)
+        self.workflow_graph = get_shift_workflow()
 
         logger.info("WorkflowManager initialized with LangGraph workflow")
 
@@ -90,6 +90,8 @@ class WorkflowManager:
             "resolved_days": resolved_days or [],  # From intent detection
             "schedule_state": schedule_state,  # From calendar service
             "messages": [],  # Will be populated by workflow
+            "system_msg_idx": None,  # System prompt is added per call, not stored
+            "first_human_msg_idx": 0,  # The triggering message starts the history
             "squad": None,
             "date": None,
             "shift_start": None,
@@ -101,6 +103,7 @@ class WorkflowManager:
             "execution_result": None,
             "current_step": "extract_parameters",
             "missing_parameters": [],
+            "resume_from": None,  # Set on resume to skip extraction
             "clarification_question": None,
             "interaction_count": 0,  # Track clarification interactions
         }
@@ -109,7 +112,7 @@ class WorkflowManager:
         workflow = self.state_manager.create_workflow(
             group_id=group_id,
             workflow_type="shift_coverage",
-            initial_state=initial_state,
+            initial_state=serialize_state(initial_state),
             user_id=message.user_id,
             squad_id=sender_squad
         )
@@ -123,14 +126,8 @@ class WorkflowManager:
         # Execute first step
         result_state = self._execute_workflow_step(workflow, initial_state)
 
-        # Serialize state before saving to database
-        serialized_state = serialize_state(result_state)
-
-        # Update workflow in database
-        self._update_workflow_from_state(workflow, serialized_state)
-
-        # Handle any outputs (clarification questions, warnings, etc.)
-        self._handle_workflow_outputs(workflow, result_state)
+        # Handle outputs (clarification questions, warnings, commands) and persist
+        self._finish_workflow_step(workflow, result_state)
 
         logger.info(f"Workflow {workflow.id} started and executed first step")
 
@@ -163,18 +160,8 @@ class WorkflowManager:
         # Clean up messages - remove tool-related messages from previous run
         # Keep only SystemMessage and reconstruct the full user message
         if "messages" in state_dict and state_dict["messages"]:
-            from langchain_core.messages import SystemMessage, HumanMessage as HM, AIMessage, ToolMessage
-
             # Find the system message and first human message
-            system_message = None
-            original_human_message = None
-
-            for msg in state_dict["messages"]:
-                if isinstance(msg, SystemMessage):
-                    system_message = msg
-                elif isinstance(msg, HM) and original_human_message is None:
-                    # Get the first human message (the original request)
-                    original_human_message = msg
+            system_message, original_human_message = self._find_context_messages(state_dict)
 
             # Reconstruct full context by combining original message + clarification
             if original_human_message:
@@ -187,8 +174,9 @@ class WorkflowManager:
                     f"The {param_name} is {message.message_text}"
                 )
 
-                logger.info(
-                    f"Reconstructing message context: original + clarification for '{param_name}'"
+                logger.debug(
+                    "Reconstructing message context: original + clarification for '%s'",
+                    param_name
                 )
 
                 # Start fresh with system message and reconstructed human message
@@ -202,26 +190,103 @@ class WorkflowManager:
                 if system_message:
                     state_dict["messages"].append(system_message)
                 state_dict["messages"].append(HumanMessage(content=message.message_text))
+
+            state_dict["system_msg_idx"] = 0 if system_message else None
+            state_dict["first_human_msg_idx"] = len(state_dict["messages"]) - 1
         else:
             # No previous messages, start fresh
             state_dict["messages"] = [HumanMessage(content=message.message_text)]
+            state_dict["system_msg_idx"] = None
+            state_dict["first_human_msg_idx"] = 0
+
+        # The pending question is answered by this message. If the answer
+        # parses unambiguously, apply it and skip LLM extraction.
+        state_dict["clarification_question"] = None
+        answered = self._apply_clarification_answer(state_dict, message.message_text)
+        state_dict["resume_from"] = "validate" if answered else None
 
         # Execute next step
         result_state = self._execute_workflow_step(workflow, state_dict)
 
-        # Serialize state before saving to database
-        serialized_state = serialize_state(result_state)
-
-        # Update workflow in database
-        self._update_workflow_from_state(workflow, serialized_state)
-
-        # Handle any outputs
-        self._handle_workflow_outputs(workflow, result_state)
+        # Handle outputs and persist
+        self._finish_workflow_step(workflow, result_state)
 
         logger.info(f"Workflow {workflow.id} resumed and executed")
 
         return workflow
 
+    @staticmethod
+    def _apply_clarification_answer(state_dict: dict, answer: str) -> bool:
+        """
+        Fill in a single missing parameter directly from the user's reply.
+
+        Args:
+            state_dict: Deserialized workflow state (updated in place)
+            answer: The user's reply to the clarification question
+
+        Returns:
+            True if the parameter was applied, False to fall back to the LLM
+        """
+        missing = state_dict.get("missing_parameters") or []
+        parsed_requests = state_dict.get("parsed_requests") or []
+        if len(missing) != 1 or not parsed_requests:
+            return False
+
+        param = missing[0]
+        value = parse_clarification_answer(param, answer)
+        if value is None:
+            logger.debug("Could not parse clarification answer for '%s'", param)
+            return False
+
+        state_dict[param] = value
+        for request in parsed_requests:
+            if not request.get(param):
+                request[param] = value
+        state_dict["missing_parameters"] = []
+
+        logger.info("Applied clarification answer for '%s' without LLM extraction", param)
+        return True
+
+    @staticmethod
+    def _find_context_messages(state_dict: dict) -> tuple:
+        """
+        Get the system message and original human message from state.
+
+        Uses the stored message indices when present; older workflow rows
+        without them fall back to scanning the message list.
+
+        Args:
+            state_dict: Deserialized workflow state with a non-empty messages list
+
+        Returns:
+            Tuple of (system_message, original_human_message); either may be None
+        """
+        messages = state_dict["messages"]
+
+        if "first_human_msg_idx" in state_dict:
+            system_idx = state_dict.get("system_msg_idx")
+            human_idx = state_dict.get("first_human_msg_idx")
+            system_message = (
+                messages[system_idx]
+                if system_idx is not None and system_idx < len(messages) else None
+            )
+            original_human_message = (
+                messages[human_idx]
+                if human_idx is not None and human_idx < len(messages) else None
+            )
+            return system_message, original_human_message
+
+        system_message = None
+        original_human_message = None
+        for msg in messages:
+            if isinstance(msg, SystemMessage):
+                system_message = msg
+            elif isinstance(msg, HumanMessage) and original_human_message is None:
+                # Get the first human message (the original request)
+                original_human_message = msg
+
+        return system_message, original_human_message
+
     def _execute_workflow_step(
         self,
         workflow: Workflow,
@@ -237,13 +302,13 @@ class WorkflowManager:
         Returns:
             Updated state dictionary after execution
         """
-        logger.debug(f"Executing workflow step for {workflow.id}")
+        logger.debug("Executing workflow step for %s", workflow.id)
 
         try:
             # Invoke the LangGraph workflow
             result = self.workflow_graph.invoke(state)
 
-            logger.debug(f"Workflow step completed: current_step={result.get('current_step')}")
+            logger.debug("Workflow step completed: current_step=%s", result.get("current_step"))
 
             return result
 
@@ -251,6 +316,27 @@ class WorkflowManager:
             logger.error(f"Error executing workflow step: {e}", exc_info=True)
             raise
 
+    def _finish_workflow_step(
+        self,
+        workflow: Workflow,
+        state: dict
+    ) -> None:
+        """
+        Handle a step's outputs, then persist the workflow once.
+
+        Outputs are handled first so command results are included in the
+        single serialize + update. The update runs even if sending an
+        output fails, so the database never lags the conversation.
+
+        Args:
+            workflow: The workflow that was executed
+            state: The result state from LangGraph execution
+        """
+        try:
+            self._handle_workflow_outputs(workflow, state)
+        finally:
+            self._update_workflow_from_state(workflow, serialize_state(state))
+
     def _update_workflow_from_state(
         self,
         workflow: Workflow,
@@ -263,7 +349,7 @@ class WorkflowManager:
 
         Args:
             workflow: The workflow to update
-            state: The result state from LangGraph execution
+            state: The serialized result state (outputs already handled)
         """
         current_step = state.get("current_step", "")
         missing_params = state.get("missing_parameters", [])
@@ -285,7 +371,10 @@ class WorkflowManager:
             else:
                 new_status = "COMPLETED"
 
-        logger.debug(f"Updating workflow {workflow.id}: status={new_status}, current_step={current_step}")
+        logger.debug(
+            "Updating workflow %s: status=%s, current_step=%s",
+            workflow.id, new_status, current_step
+        )
 
         # Update in database (state is already serialized by caller)
         self.state_manager.update_workflow(
@@ -310,6 +399,16 @@ class WorkflowManager:
             workflow: The workflow
             state: Current state with outputs
         """
+        execution_result = state.get("execution_result")
+        has_outputs = bool(
+            state.get("clarification_question")
+            or state.get("validation_warnings")
+            or (execution_result or {}).get("status") == "prepared"
+        )
+        if not has_outputs:
+            logger.debug("No outputs to handle for workflow %s", workflow.id)
+            return
+
         # Handle clarification questions
         clarification = state.get("clarification_question")
         if clarification:
@@ -323,57 +422,25 @@ class WorkflowManager:
             except Exception as e:
                 logger.error(f"Failed to send clarification question: {e}")
 
-        # Handle warnings
-        warnings = state.get("validation_warnings", [])
-        for warning in warnings:
-            logger.info(f"Sending warning: {warning}")
-            try:
-                self.groupme_client.send_warning(
-                    warning,
-                    workflow_id=workflow.id,
-                    group_id=workflow.group_id
-                )
-            except Exception as e:
-                logger.error(f"Failed to send warning: {e}")
+        # Handle warnings (posted in order)
+        for warning in state.get("validation_warnings", []):
+            self._send_warning(workflow, warning)
 
         # Handle command execution (supports multiple commands)
-        execution_result = state.get("execution_result")
         if execution_result and execution_result.get("status") == "prepared":
             # Support both old "command" (singular) and new "commands" (plural)
             commands_list = execution_result.get("commands") or [execution_result.get("command")]
-            commands_list = [cmd for cmd in commands_list if cmd is not None]
+            commands_list = self._dedupe_commands(
+                [cmd for cmd in commands_list if cmd is not None]
+            )
 
             if commands_list:
                 logger.info(f"Executing {len(commands_list)} calendar command(s)")
 
-                results = []
-                successful = 0
-                failed = 0
-
-                for idx, command_dict in enumerate(commands_list, 1):
-                    try:
-                        command = CalendarCommand(**command_dict)
-                        logger.info(
-                            f"Executing command {idx}/{len(commands_list)}: "
-                            f"{command.action} for Squad {command.squad} on {command.date}"
-                        )
-
-                        result = self.calendar_client.send_command_with_retry(command)
-                        results.append({
-                            "command": command_dict,
-                            "status": "success",
-                            "response": result
-                        })
-                        successful += 1
-
-                    except Exception as e:
-                        logger.error(f"Failed to execute command {idx}: {e}", exc_info=True)
-                        results.append({
-                            "command": command_dict,
-                            "status": "error",
-                            "error": str(e)
-                        })
-                        failed += 1
+                outcomes = self._execute_commands(commands_list)
+                results = [result for _, result in outcomes]
+                successful = sum(1 for r in results if r["status"] == "success")
+                failed = len(results) - successful
 
                 # Update state with all execution results
                 state["execution_result"]["status"] = "success" if failed == 0 else "partial"
@@ -384,21 +451,13 @@ class WorkflowManager:
                     "failed": failed
                 }
 
-                # Serialize state before saving
-                serialized_state = serialize_state(state)
-
-                # Update workflow to COMPLETED
-                self.state_manager.update_workflow(
-                    workflow_id=workflow.id,
-                    status="COMPLETED",
-                    state=serialized_state
-                )
+                # (Workflow is persisted as COMPLETED by _finish_workflow_step)
 
                 # Send confirmation to chat
                 if successful > 0:
                     if successful == 1 and len(commands_list) == 1:
                         # Single command confirmation
-                        cmd = CalendarCommand(**commands_list[0])
+                        cmd = outcomes[0][0]
                         confirmation = (
                             f"✅ Updated schedule: {cmd.action} for Squad {cmd.squad} "
                             f"on {cmd.date} ({cmd.shift_start}-{cmd.shift_end})"
@@ -429,3 +488,123 @@ class WorkflowManager:
                 logger.info(
                     f"Calendar commands executed: {successful} successful, {failed} failed"
                 )
+
+    def _send_warning(self, workflow: Workflow, warning: str) -> None:
+        """
+        Send a single validation warning to the workflow's group.
+
+        Errors are logged rather than raised so one failed post does not
+        stop the remaining warnings.
+
+        Args:
+            workflow: The workflow the warning belongs to
+            warning: Warning text
+        """
+        logger.debug("Sending warning: %s", warning)
+        try:
+            self.groupme_client.send_warning(
+                warning,
+                workflow_id=workflow.id,
+                group_id=workflow.group_id
+            )
+        except Exception as e:
+            logger.error("Failed to send warning: %s", e)
+
+    @staticmethod
+    def _dedupe_commands(commands_list: list[dict]) -> list[dict]:
+        """
+        Drop repeated calendar commands, keeping the first occurrence.
+
+        The LLM sometimes emits the same command more than once; each
+        duplicate would otherwise cost a calendar API call.
+
+        Args:
+            commands_list: Command dictionaries in LLM order
+
+        Returns:
+            Commands with duplicates removed (order preserved)
+        """
+        seen = set()
+        unique = []
+        for command in commands_list:
+            key = (
+                command.get("action"),
+                command.get("squad"),
+                command.get("date"),
+                command.get("shift_start"),
+                command.get("shift_end"),
+            )
+            if key not in seen:
+                seen.add(key)
+                unique.append(command)
+
+        dropped = len(commands_list) - len(unique)
+        if dropped:
+            logger.info("Dropped %d duplicate calendar command(s)", dropped)
+
+        return unique
+
+    def _execute_commands(
+        self,
+        commands_list: list[dict]
+    ) -> list[tuple[CalendarCommand | None, dict]]:
+        """
+        Execute calendar commands in order.
+
+        Commands run sequentially: an overnight shift touches two dates, so
+        commands for different dates are not necessarily independent, and
+        the calendar log is only readable when requests do not interleave.
+
+        Args:
+            commands_list: Command dicts to execute
+
+        Returns:
+            (CalendarCommand, result dict) pairs in the same order as
+            commands_list; the command is None if it failed validation
+        """
+        total = len(commands_list)
+        return [
+            self._execute_command(idx, total, command_dict)
+            for idx, command_dict in enumerate(commands_list, 1)
+        ]
+
+    def _execute_command(
+        self,
+        idx: int,
+        total: int,
+        command_dict: dict
+    ) -> tuple[CalendarCommand | None, dict]:
+        """
+        Execute a single calendar command.
+
+        Args:
+            idx: 1-based position of the command (for logging)
+            total: Total number of commands (for logging)
+            command_dict: Command fields
+
+        Returns:
+            Tuple of (validated CalendarCommand or None, result dict with
+            command, status, and response or error)
+        """
+        command = None
+        try:
+            command = CalendarCommand(**command_dict)
+            logger.debug(
+                "Executing command %d/%d: %s for Squad %s on %s",
+                idx, total, command.action, command.squad, command.date
+            )
+
+            result = self.calendar_client.send_command_with_retry(command)
+            return command, {
+                "command": command_dict,
+                "status": "success",
+                "response": result
+            }
+
+        except Exception as e:
+            logger.error("Failed to execute command %d: %s", idx, e, exc_info=True)
+            return command, {
+                "command": command_dict,
+                "status": "error",
+                "error": str(e)
+            }
@@ -1,5 +1,5 @@
 """LangGraph workflows for stateful multi-turn conversations."""
 
-from .shift_coverage import create_shift_workflow
+from .shift_coverage import create_shift_workflow, get_shift_workflow, parse_clarification_answer
 
-__all__ = ["create_shift_workflow"]
+__all__ = ["create_shift_workflow", "get_shift_workflow", "parse_clarification_answer"]
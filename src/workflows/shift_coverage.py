@@ -1,15 +1,19 @@
 """LangGraph workflow for shift coverage requests."""
 
-import json
+import functools
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Literal, TypedDict, Annotated
 import operator
 
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+import orjson
+from langchain_core.messages import SystemMessage, AIMessage
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, END
+from langgraph.prebuilt import ToolNode
+from pydantic import TypeAdapter
 
 from ..config import settings
 from ..models import WorkflowStateData, CalendarCommand
@@ -18,6 +22,12 @@ from ..tools import all_tools
 logger = logging.getLogger(__name__)
 llm_logger = logging.getLogger("llm")
 
+# Max LLM calls per extraction: one tool round plus the final answer
+MAX_LLM_ROUNDS = 2
+
+# Executes the LLM's tool calls (the tool list is static)
+_TOOL_NODE = ToolNode(all_tools)
+
 
 # =============================================================================
 # State Definition
@@ -42,6 +52,8 @@ class ShiftWorkflowState(TypedDict):
 
     # Conversation history (accumulates messages)
     messages: Annotated[list, operator.add]
+    system_msg_idx: int | None  # Index of the SystemMessage in messages (None if absent)
+    first_human_msg_idx: int | None  # Index of the original user request in messages
 
     # Extracted parameters (for single action or clarification)
     squad: int | None
@@ -63,6 +75,7 @@ class ShiftWorkflowState(TypedDict):
     # Control flow
     current_step: str
     missing_parameters: list[str]
+    resume_from: str | None  # "validate" skips LLM extraction (answer already applied)
     clarification_question: str | None
     reasoning: str | None  # LLM's reasoning (for no-action scenarios)
 
@@ -72,8 +85,9 @@ class ShiftWorkflowState(TypedDict):
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1)
 def load_system_prompt() -> str:
-    """Load the system prompt from file."""
+    """Load the system prompt from file (read once per process)."""
     prompt_path = Path(settings.system_prompt_path)
 
     if not prompt_path.exists():
@@ -83,22 +97,189 @@ def load_system_prompt() -> str:
     return prompt_path.read_text()
 
 
+# First single-brace {placeholder} in the prompt template
+_PLACEHOLDER_RE = re.compile(r"(?<!\{)\{[a-z_]+\}(?!\})")
+
+
+@functools.lru_cache(maxsize=1)
+def load_prompt_parts() -> tuple[str, str]:
+    """
+    Split the system prompt into a static prefix and a dynamic template.
+
+    The split falls at the start of the section holding the first
+    placeholder, so the static prefix is identical across requests and
+    can be served from the provider's prompt cache (OpenAI caches
+    repeated prompt prefixes automatically).
+
+    Returns:
+        Tuple of (static_prefix, dynamic_template); only the dynamic
+        template needs str.format()
+    """
+    template = load_system_prompt()
+
+    match = _PLACEHOLDER_RE.search(template)
+    if not match:
+        return template.format(), ""
+
+    # Back up to the blank line that starts the placeholder's section
+    section_start = template.rfind("\n\n", 0, match.start())
+    split_at = section_start + 2 if section_start != -1 else 0
+
+    # Static part has no placeholders; format() only unescapes {{ }}
+    return template[:split_at].format(), template[split_at:]
+
+
+@functools.lru_cache(maxsize=1)
 def create_llm() -> ChatOpenAI:
-    """Create and configure the LLM instance."""
+    """
+    Create and configure the LLM instance.
+
+    Cached so every workflow step reuses one client and its HTTP
+    connection pool.
+    """
+    model_kwargs = {}
+
+    # Optional latency tier (e.g. "priority"); passed through to the API
+    if settings.openai_service_tier:
+        model_kwargs["service_tier"] = settings.openai_service_tier
+
     llm = ChatOpenAI(
         model="gpt-4o",
         temperature=0.3,
-        api_key=settings.openai_api_key
+        api_key=settings.openai_api_key,
+        model_kwargs=model_kwargs
     )
-    print(f'Here is the thingy: {settings.openai_api_key}')
     # Debug logging to verify actual model and API key presence
-    logger.info(f"Created LLM with model_name attr: {getattr(llm, 'model_name', 'N/A')}")
-    logger.info(f"Created LLM with model attr: {getattr(llm, 'model', 'N/A')}")
-    logger.info(f"API key configured: {bool(settings.openai_api_key)}")
-    logger.info(f"API key length: {len(settings.openai_api_key) if settings.openai_api_key else 0}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Created LLM with model_name attr: {getattr(llm, 'model_name', 'N/A')}")
+        logger.debug(f"Created LLM with model attr: {getattr(llm, 'model', 'N/A')}")
+        logger.debug(f"API key configured: {bool(settings.openai_api_key)}")
+        logger.debug(f"Service tier: {settings.openai_service_tier or 'account default'}")
     return llm
 
 
+@functools.lru_cache(maxsize=1)
+def get_llm_with_tools():
+    """
+    Return the shared LLM with all_tools bound.
+
+    Cached so the tool schemas are converted to the OpenAI format once
+    rather than on every call that offers tools.
+    """
+    return create_llm().bind_tools(all_tools)
+
+
+@functools.lru_cache(maxsize=1)
+def get_json_llm():
+    """
+    Return the shared LLM in JSON mode, for rounds that offer no tools.
+
+    langchain-openai sends any response_format through the beta parse
+    endpoint, which rejects non-strict tools, so JSON mode is only
+    applied when no tools are bound.
+    """
+    return create_llm().bind(response_format={"type": "json_object"})
+
+
+def _compact_json(obj) -> str:
+    """Serialize to JSON without indentation or padding (fewer prompt tokens)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def format_schedule_state(schedule_state: dict | None) -> str:
+    """
+    Format the schedule state for the system prompt.
+
+    Uses compact JSON: same structure the prompt documents, but without
+    the indentation whitespace that made up over half of its tokens.
+
+    Args:
+        schedule_state: Calendar service response (may hold the schedule
+            as a "day_schedule" JSON string)
+
+    Returns:
+        Schedule text to embed in the prompt
+    """
+    if not schedule_state:
+        return "Schedule state not available"
+
+    # Parse the day_schedule JSON string if present
+    if isinstance(schedule_state, dict) and "day_schedule" in schedule_state:
+        try:
+            return _format_day_schedule(
+                schedule_state["day_schedule"],
+                schedule_state.get("success"),
+                schedule_state.get("action"),
+                schedule_state.get("date"),
+            )
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to parse day_schedule JSON: {e}")
+
+    return _compact_json(schedule_state)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_day_schedule(day_schedule: str) -> dict:
+    """Parse a day_schedule JSON string (memoized; do not mutate the result)."""
+    return orjson.loads(day_schedule)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_day_schedule(day_schedule: str, success, action, date) -> str:
+    """
+    Build the prompt text for a day_schedule response.
+
+    Memoized on the raw schedule string, so a schedule is parsed and
+    re-serialized once per process rather than on every workflow step.
+    """
+    # Create a clean format for the LLM
+    return _compact_json({
+        "success": success,
+        "action": action,
+        "date": date,
+        "schedule": _parse_day_schedule(day_schedule)  # Now properly parsed
+    })
+
+
+def _log_llm_request(llm: ChatOpenAI, messages: list, round_num: int, with_tools: bool) -> None:
+    """Log an outgoing LLM request to the LLM communications log."""
+    # Skip walking the (large) message contents when the log is off
+    if not llm_logger.isEnabledFor(logging.INFO):
+        return
+
+    llm_logger.info("=" * 80)
+    llm_logger.info("COMPONENT: Shift Coverage Workflow")
+    llm_logger.info("MODEL: %s", llm.model_name)
+    llm_logger.info("LLM REQUEST #%d (%s)", round_num, "with tools" if with_tools else "no tools")
+    llm_logger.info("Messages being sent (%d messages):", len(messages))
+    for i, msg in enumerate(messages):
+        llm_logger.info("  [%d] %s:", i, msg.__class__.__name__)
+        llm_logger.info(msg.content)
+
+
+def _log_llm_response(response, round_num: int) -> None:
+    """Log an LLM response to the LLM communications log."""
+    if not llm_logger.isEnabledFor(logging.INFO):
+        return
+
+    llm_logger.info("-" * 80)
+    llm_logger.info("LLM RESPONSE #%d", round_num)
+    llm_logger.info("Type: %s", response.__class__.__name__)
+
+    # Log what model OpenAI actually used (from response metadata)
+    if hasattr(response, 'response_metadata'):
+        actual_model = response.response_metadata.get('model_name', 'NOT_FOUND')
+        llm_logger.info("ACTUAL MODEL USED BY API: %s", actual_model)
+        llm_logger.info("Full response_metadata: %s", response.response_metadata)
+
+    llm_logger.info("Content: %s", response.content)
+    if hasattr(response, "tool_calls") and response.tool_calls:
+        llm_logger.info("Tool calls: %d", len(response.tool_calls))
+        for tc in response.tool_calls:
+            llm_logger.info("  - %s: %s", tc.get('name', 'unknown'), tc.get('args', {}))
+    llm_logger.info("=" * 80)
+
+
 # =============================================================================
 # Workflow Nodes
 # =============================================================================
@@ -112,42 +293,31 @@ def extract_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     - Uses the LLM with tools to extract squad, date, shift times, and action
     - Can extract multiple parameters from a single message
     - Identifies which parameters are still missing
+    - Validates complete requests so they can go straight to execution
     """
     logger.info("🤖 Node: Extract Parameters")
 
+    # The caller already applied the clarification answer; only validate
+    if state.get("resume_from") == "validate":
+        logger.info("Clarification answer applied, skipping LLM extraction")
+        state["messages"] = []
+        return validate_parameters_node(state)
+
     try:
-        # Load system prompt template
-        system_prompt_template = load_system_prompt()
+        messages = state.get("messages") or []
+        resolved_days = state.get("resolved_days", [])
+
+        # Static prompt prefix (cacheable) + per-request template
+        static_prefix, system_prompt_template = load_prompt_parts()
 
         # Format with current context
         message_time = datetime.now()
 
         # Format resolved days
-        resolved_days = state.get("resolved_days", [])
         resolved_days_str = ", ".join(resolved_days) if resolved_days else "Not specified"
 
         # Format schedule state
-        schedule_state = state.get("schedule_state")
-        if schedule_state:
-            # Parse the day_schedule JSON string if present
-            if isinstance(schedule_state, dict) and "day_schedule" in schedule_state:
-                try:
-                    # Parse the nested JSON string
-                    parsed_schedule = json.loads(schedule_state["day_schedule"])
-                    # Create a clean format for the LLM
-                    schedule_state_str = json.dumps({
-                        "success": schedule_state.get("success"),
-                        "action": schedule_state.get("action"),
-                        "date": schedule_state.get("date"),
-                        "schedule": parsed_schedule  # Now properly parsed
-                    }, indent=2)
-                except (json.JSONDecodeError, KeyError) as e:
-                    logger.warning(f"Failed to parse day_schedule JSON: {e}")
-                    schedule_state_str = json.dumps(schedule_state, indent=2)
-            else:
-                schedule_state_str = json.dumps(schedule_state, indent=2)
-        else:
-            schedule_state_str = "Schedule state not available"
+        schedule_state_str = format_schedule_state(state.get("schedule_state"))
 
         # Format the template first WITHOUT schedule_state (to avoid brace conflicts)
         system_prompt = system_prompt_template.format(
@@ -157,123 +327,70 @@ def extract_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
             sender_role=state.get("sender_role") or "Unknown",
             resolved_days=resolved_days_str,
             schedule_state="PLACEHOLDER_FOR_SCHEDULE_STATE",
-            user_message=state["messages"][-1].content if state["messages"] else ""
+            user_message=messages[-1].content if messages else ""
         )
 
         # Now replace the placeholder with the actual schedule (which contains braces)
-        system_prompt = system_prompt.replace("PLACEHOLDER_FOR_SCHEDULE_STATE", schedule_state_str)
+        system_prompt = static_prefix + system_prompt.replace(
+            "PLACEHOLDER_FOR_SCHEDULE_STATE", schedule_state_str
+        )
 
-        # Create LLM with tools
+        # Create LLM, binding tools only when no dates were resolved upfront
+        # (each bound tool adds its JSON schema to every request)
         llm = create_llm()
-        llm_with_tools = llm.bind_tools(all_tools)
-
-        # Initialize messages if first call
-        if not state.get("messages"):
-            state["messages"] = []
+        tools = [] if resolved_days else all_tools
+        llm_with_tools = get_llm_with_tools() if tools else llm
 
         # Add system message if not present
-        if not any(isinstance(msg, SystemMessage) for msg in state["messages"]):
-            state["messages"] = [SystemMessage(content=system_prompt)] + state["messages"]
-
-        # Log LLM request
-        llm_logger.info("=" * 80)
-        llm_logger.info("COMPONENT: Shift Coverage Workflow")
-        llm_logger.info(f"MODEL: {llm.model_name}")
-        llm_logger.info("LLM REQUEST (with tools)")
-        llm_logger.info(f"Messages being sent ({len(state['messages'])} messages):")
-        for i, msg in enumerate(state["messages"]):
-            msg_type = msg.__class__.__name__
-            llm_logger.info(f"  [{i}] {msg_type}:")
-            llm_logger.info(msg.content)
-
-        # Call LLM
+        conversation = list(messages)
+        if not any(isinstance(msg, SystemMessage) for msg in conversation):
+            conversation.insert(0, SystemMessage(content=system_prompt))
+
         # Log the actual model being invoked
         logger.info(f"Invoking LLM - Model from object: {llm.model_name if hasattr(llm, 'model_name') else llm.model}")
 
-        # Dump exact prompt for manual testing comparison
-        # logger.info("=" * 80)
-        # logger.info("EXACT PROMPT FOR MANUAL TESTING:")
-        # for i, msg in enumerate(state["messages"]):
-        #     logger.info(f"\n--- Message {i} ({msg.__class__.__name__}) ---")
-        #     logger.info(msg.content)
-        # logger.info("=" * 80)
-
-        response = llm_with_tools.invoke(state["messages"])
-
-        # Log LLM response
-        llm_logger.info("-" * 80)
-        llm_logger.info("LLM RESPONSE")
-        llm_logger.info(f"Type: {response.__class__.__name__}")
-
-        # Log what model OpenAI actually used (from response metadata)
-        if hasattr(response, 'response_metadata'):
-            actual_model = response.response_metadata.get('model_name', 'NOT_FOUND')
-            llm_logger.info(f"ACTUAL MODEL USED BY API: {actual_model}")
-            llm_logger.info(f"Full response_metadata: {response.response_metadata}")
-
-        llm_logger.info(f"Content: {response.content}")
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            llm_logger.info(f"Tool calls: {len(response.tool_calls)}")
-            for tc in response.tool_calls:
-                llm_logger.info(f"  - {tc.get('name', 'unknown')}: {tc.get('args', {})}")
-        llm_logger.info("=" * 80)
-
-        # Add response to messages
-        new_messages = [response]
-
-        # If LLM made tool calls, we need to execute them and call again
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            logger.info(f"LLM made {len(response.tool_calls)} tool call(s)")
+        # Bounded tool loop: the model answers directly unless it calls a
+        # tool, in which case it gets one more turn (without tools) to
+        # answer from the tool results
+        new_messages = []
+        for round_num in range(1, MAX_LLM_ROUNDS + 1):
+            round_tools = tools if round_num < MAX_LLM_ROUNDS else []
+            round_llm = llm_with_tools if round_tools else get_json_llm()
 
-            # Execute tools (simplified - in production use ToolNode)
-            from langgraph.prebuilt import ToolNode
-            tool_node = ToolNode(all_tools)
-            tool_result = tool_node.invoke({"messages": state["messages"] + [response]})
+            _log_llm_request(llm, conversation, round_num, bool(round_tools))
+            response = round_llm.invoke(conversation)
+            _log_llm_response(response, round_num)
 
-            if "messages" in tool_result:
-                new_messages.extend(tool_result["messages"])
+            new_messages.append(response)
+            conversation.append(response)
 
-                # Call LLM again with tool results
-                new_messages.append(
-                    HumanMessage(content="Based on the tool results, provide your analysis in JSON format.")
-                )
+            if not getattr(response, "tool_calls", None):
+                break
+
+            logger.info(f"LLM made {len(response.tool_calls)} tool call(s)")
 
-                # Log second LLM request
-                all_messages = state["messages"] + new_messages
-                llm_logger.info("=" * 80)
-                llm_logger.info("COMPONENT: Shift Coverage Workflow")
-                llm_logger.info(f"MODEL: {llm.model_name}")
-                llm_logger.info("LLM REQUEST #2 (after tool execution)")
-                llm_logger.info(f"Messages being sent ({len(all_messages)} messages):")
-                for i, msg in enumerate(all_messages):  # Log all messages
-                    msg_type = msg.__class__.__name__
-                    content = msg.content if hasattr(msg, 'content') else str(msg)
-                    llm_logger.info(f"  [{i}] {msg_type}:")
-                    llm_logger.info(content)
-
-                final_response = llm.invoke(all_messages)
-
-                # Log second LLM response
-                llm_logger.info("-" * 80)
-                llm_logger.info("LLM RESPONSE #2")
-                llm_logger.info(f"Type: {final_response.__class__.__name__}")
-                llm_logger.info(f"Content: {final_response.content}")
-                llm_logger.info("=" * 80)
-
-                new_messages.append(final_response)
-                response = final_response
+            # Execute tools. ToolNode runs multiple tool calls concurrently
+            # and only reads the last AIMessage, so pass just the response.
+            tool_result = _TOOL_NODE.invoke({"messages": [response]})
+
+            tool_messages = tool_result.get("messages", [])
+            new_messages.extend(tool_messages)
+            conversation.extend(tool_messages)
 
         # Extract JSON from response
         content = response.content if hasattr(response, "content") else str(response)
 
         try:
-            # Find JSON in response
-            json_start = content.find("{")
-            json_end = content.rfind("}") + 1
+            # JSON mode returns a bare object; only scan for the outermost
+            # braces when the content is something else
+            json_str = content
+            if not content.lstrip().startswith("{"):
+                json_start = content.find("{")
+                json_end = content.rfind("}") + 1
+                json_str = content[json_start:json_end] if json_start != -1 and json_end > json_start else None
 
-            if json_start != -1 and json_end > json_start:
-                json_str = content[json_start:json_end]
-                analysis = json.loads(json_str)
+            if json_str:
+                analysis = orjson.loads(json_str)
 
                 logger.info(f"✅ Parsed LLM analysis: confidence={analysis.get('confidence', 0)}")
 
@@ -284,8 +401,8 @@ def extract_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
                 logger.info(f"Extracted {len(parsed_requests)} action(s) to execute")
 
                 # For clarification purposes, extract first request's parameters
-                if parsed_requests and len(parsed_requests) > 0:
-                    req = parsed_requests[0]  # First request for clarification context
+                req = parsed_requests[0] if parsed_requests else {}
+                if req:
                     state["squad"] = req.get("squad")
                     state["date"] = req.get("date")
                     state["shift_start"] = req.get("shift_start")
@@ -293,28 +410,30 @@ def extract_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
                     state["action"] = req.get("action")
 
                 # Extract missing parameters
-                state["missing_parameters"] = analysis.get("missing_parameters", [])
+                missing_parameters = analysis.get("missing_parameters", [])
+                state["missing_parameters"] = missing_parameters
 
                 # Extract warnings and reasoning
-                state["validation_warnings"] = analysis.get("warnings", [])
+                warnings = analysis.get("warnings", [])
+                state["validation_warnings"] = warnings
 
                 # Store reasoning from LLM (used when no action needed)
                 if "reasoning" in analysis:
                     state["reasoning"] = analysis["reasoning"]
 
                 logger.info(
-                    f"First action: squad={state.get('squad')}, date={state.get('date')}, "
-                    f"shift={state.get('shift_start')}-{state.get('shift_end')}, action={state.get('action')}"
+                    f"First action: squad={req.get('squad')}, date={req.get('date')}, "
+                    f"shift={req.get('shift_start')}-{req.get('shift_end')}, action={req.get('action')}"
                 )
-                logger.info(f"Missing: {state['missing_parameters']}")
-                if state.get("validation_warnings"):
-                    logger.info(f"Warnings: {state['validation_warnings']}")
+                logger.info(f"Missing: {missing_parameters}")
+                if warnings:
+                    logger.info(f"Warnings: {warnings}")
 
             else:
                 logger.warning("No JSON found in LLM response")
                 state["missing_parameters"] = ["squad", "date", "shift_start", "shift_end"]
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from LLM response: {e}")
             state["missing_parameters"] = ["squad", "date", "shift_start", "shift_end"]
 
@@ -322,6 +441,10 @@ def extract_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
         state["messages"] = new_messages
         state["current_step"] = "extract_parameters"
 
+        # Validate in the same pass when nothing is missing
+        if state.get("parsed_requests") and not state.get("missing_parameters"):
+            validate_parameters_node(state)
+
         return state
 
     except Exception as e:
@@ -330,6 +453,19 @@ def extract_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
         return state
 
 
+# Priority order for asking questions
+_PRIORITY_ORDER = ("squad", "date", "shift_start", "shift_end", "action")
+
+# Clarification question for each parameter
+_QUESTIONS = {
+    "squad": "Which squad won't be available? (34, 35, 42, 43, or 54)",
+    "date": "What date are you referring to? (e.g., 'Saturday', 'December 25', or '12/25')",
+    "shift_start": "What time does the shift start? (e.g., '6 PM' or '1800')",
+    "shift_end": "What time does the shift end? (e.g., '6 AM' or '0600')",
+    "action": "Do you want to remove the shift, add a shift, or obliterate it completely?"
+}
+
+
 def request_clarification_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     """
     Node 2: Generate and send clarification question for missing parameter.
@@ -348,29 +484,11 @@ def request_clarification_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
         logger.warning("request_clarification_node called but no missing parameters")
         return state
 
-    # Priority order for asking questions
-    priority_order = ["squad", "date", "shift_start", "shift_end", "action"]
-
     # Find first missing parameter in priority order
-    param_to_ask = None
-    for param in priority_order:
-        if param in missing:
-            param_to_ask = param
-            break
-
-    if not param_to_ask:
-        param_to_ask = missing[0]
-
-    # Generate question based on parameter
-    questions = {
-        "squad": f"Which squad won't be available? (34, 35, 42, 43, or 54)",
-        "date": "What date are you referring to? (e.g., 'Saturday', 'December 25', or '12/25')",
-        "shift_start": "What time does the shift start? (e.g., '6 PM' or '1800')",
-        "shift_end": "What time does the shift end? (e.g., '6 AM' or '0600')",
-        "action": "Do you want to remove the shift, add a shift, or obliterate it completely?"
-    }
+    missing_set = set(missing)
+    param_to_ask = next((p for p in _PRIORITY_ORDER if p in missing_set), missing[0])
 
-    question = questions.get(param_to_ask, f"Can you provide the {param_to_ask}?")
+    question = _QUESTIONS.get(param_to_ask) or f"Can you provide the {param_to_ask}?"
 
     logger.info(f"Asking for: {param_to_ask}")
     logger.info(f"Question: {question}")
@@ -381,45 +499,71 @@ def request_clarification_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     return state
 
 
-def validate_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
+_REQUIRED_PARAMS = ("squad", "date", "shift_start", "shift_end")
+_VALID_SQUADS = frozenset({34, 35, 42, 43, 54})
+_YYYYMMDD_RE = re.compile(r"[0-9]{8}")
+_HHMM_RE = re.compile(r"[0-9]{4}")
+
+
+def _validate_request(params: dict) -> list[str]:
     """
-    Node 3: Validate that all parameters are present and valid.
+    Check one request's parameters for presence and format.
 
-    This node:
-    - Verifies all required parameters are present
-    - Validates formats (date, times, squad number)
-    - Sets validation_passed flag
+    Args:
+        params: Mapping with squad, date, shift_start and shift_end
+
+    Returns:
+        List of problems found (empty if the request is valid)
     """
-    logger.info("✅ Node: Validate Parameters")
+    problems = []
 
-    warnings = []
-    passed = True
+    values = {param: params.get(param) for param in _REQUIRED_PARAMS}
 
     # Check all parameters are present
-    required = ["squad", "date", "shift_start", "shift_end"]
-    for param in required:
-        if not state.get(param):
-            warnings.append(f"Missing required parameter: {param}")
-            passed = False
+    for param, value in values.items():
+        if not value:
+            problems.append(f"Missing required parameter: {param}")
 
     # Validate squad number
-    squad = state.get("squad")
-    if squad and squad not in [34, 35, 42, 43, 54]:
-        warnings.append(f"Invalid squad number: {squad}")
-        passed = False
+    squad = values["squad"]
+    if squad and (not isinstance(squad, int) or squad not in _VALID_SQUADS):
+        problems.append(f"Invalid squad number: {squad}")
 
     # Validate date format (YYYYMMDD)
-    date = state.get("date")
-    if date and (len(date) != 8 or not date.isdigit()):
-        warnings.append(f"Invalid date format: {date} (expected YYYYMMDD)")
-        passed = False
+    date = values["date"]
+    if date and (not isinstance(date, str) or not _YYYYMMDD_RE.fullmatch(date)):
+        problems.append(f"Invalid date format: {date} (expected YYYYMMDD)")
 
     # Validate time formats (HHMM)
-    for time_field in ["shift_start", "shift_end"]:
-        time_val = state.get(time_field)
-        if time_val and (len(time_val) != 4 or not time_val.isdigit()):
-            warnings.append(f"Invalid {time_field} format: {time_val} (expected HHMM)")
-            passed = False
+    for time_field in ("shift_start", "shift_end"):
+        time_val = values[time_field]
+        if time_val and (not isinstance(time_val, str) or not _HHMM_RE.fullmatch(time_val)):
+            problems.append(f"Invalid {time_field} format: {time_val} (expected HHMM)")
+
+    return problems
+
+
+def validate_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
+    """
+    Validate that all parameters are present and valid.
+
+    Not a graph node: extract_parameters_node calls this at the end of
+    its pass so routing can go straight to execution.
+
+    This step:
+    - Verifies all required parameters are present in every parsed request
+    - Validates formats (date, times, squad number)
+    - Sets validation_passed flag
+    """
+    logger.info("✅ Validate Parameters")
+
+    # Validate every request that will be executed, not just the first
+    warnings = []
+    for params in state.get("parsed_requests") or [state]:
+        for problem in _validate_request(params):
+            if problem not in warnings:
+                warnings.append(problem)
+    passed = not warnings
 
     # Infer action if not set
     if not state.get("action"):
@@ -438,9 +582,13 @@ def validate_parameters_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     return state
 
 
+# Validator for the prepared command list
+_COMMAND_LIST_ADAPTER = TypeAdapter(list[CalendarCommand])
+
+
 def execute_command_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     """
-    Node 4: Execute the calendar commands.
+    Node 3: Execute the calendar commands.
 
     This node:
     - Loops through ALL parsed_requests
@@ -452,38 +600,41 @@ def execute_command_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     logger.info("⚡ Node: Execute Commands")
 
     try:
-        parsed_requests = state.get("parsed_requests", [])
-
-        if not parsed_requests:
+        parsed_requests = state.get("parsed_requests") or [
             # Fallback to single command from state fields
-            parsed_requests = [{
+            {
                 "action": state["action"],
                 "squad": state["squad"],
                 "date": state["date"],
                 "shift_start": state["shift_start"],
                 "shift_end": state["shift_end"]
-            }]
+            }
+        ]
 
         logger.info(f"Preparing {len(parsed_requests)} command(s) for execution")
 
-        commands = []
-        for idx, req in enumerate(parsed_requests, 1):
-            command = CalendarCommand(
-                action=req.get("action"),
-                squad=req.get("squad"),
-                date=req.get("date"),
-                shift_start=req.get("shift_start"),
-                shift_end=req.get("shift_end"),
-                preview=False
-            )
+        # Validate all commands in one call; a ValidationError lists every
+        # invalid item, not just the first
+        commands = _COMMAND_LIST_ADAPTER.dump_python(
+            _COMMAND_LIST_ADAPTER.validate_python([
+                {
+                    "action": req.get("action"),
+                    "squad": req.get("squad"),
+                    "date": req.get("date"),
+                    "shift_start": req.get("shift_start"),
+                    "shift_end": req.get("shift_end"),
+                    "preview": False,
+                }
+                for req in parsed_requests
+            ])
+        )
 
+        for idx, command in enumerate(commands, 1):
             logger.info(
-                f"Command {idx}/{len(parsed_requests)}: {command.action} for squad {command.squad} "
-                f"on {command.date} ({command.shift_start}-{command.shift_end})"
+                f"Command {idx}/{len(commands)}: {command['action']} for squad {command['squad']} "
+                f"on {command['date']} ({command['shift_start']}-{command['shift_end']})"
             )
 
-            commands.append(command.model_dump())
-
         # Note: Actual execution will be done by WorkflowManager
         # This node just prepares the commands
         state["execution_result"] = {
@@ -508,7 +659,7 @@ def execute_command_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
 
 def complete_no_action_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     """
-    Node 5: Complete workflow when no action is needed.
+    Node 4: Complete workflow when no action is needed.
 
     This node:
     - Sends the LLM's warnings/reasoning to the user
@@ -547,18 +698,89 @@ def complete_no_action_node(state: ShiftWorkflowState) -> ShiftWorkflowState:
     return state
 
 
+# =============================================================================
+# Clarification Answers
+# =============================================================================
+
+# Each pattern must match the whole reply so that anything more than a
+# bare answer ("don't remove it", "35 but Sunday instead") goes to the LLM
+
+# "35", "squad 35"
+_SQUAD_RE = re.compile(r"^(?:squad\s*)?(\d{2})$")
+
+# "1800", "18:00", "6 PM", "6:30am", "6 p.m."
+_TIME_RE = re.compile(r"^(\d{1,2}):?(\d{2})?(?:\s*([ap])\.?\s*m?\.?)?$")
+
+# Keywords from the "action" clarification question
+_ACTION_RE = re.compile(r"^(remove|add|obliterate)$")
+_ACTION_KEYWORDS = {
+    "remove": "noCrew",
+    "add": "addShift",
+    "obliterate": "obliterateShift",
+}
+
+
+def parse_clarification_answer(param: str, text: str) -> int | str | None:
+    """
+    Parse a user's reply to a single-parameter clarification question.
+
+    Only replies that consist of nothing but the answer are accepted;
+    anything else returns None so the caller can fall back to LLM
+    extraction. Dates are always left to the LLM since they need the
+    schedule context.
+
+    Args:
+        param: Parameter that was asked for (squad, shift_start, shift_end, action)
+        text: The user's reply
+
+    Returns:
+        Parsed value in workflow state format, or None if not recognized
+    """
+    answer = text.strip().lower()
+
+    if param == "squad":
+        match = _SQUAD_RE.match(answer)
+        squad = int(match.group(1)) if match else None
+        return squad if squad in _VALID_SQUADS else None
+
+    if param in ("shift_start", "shift_end"):
+        match = _TIME_RE.match(answer)
+        if not match:
+            return None
+        hour, minute = int(match.group(1)), int(match.group(2) or 0)
+        meridiem = match.group(3)
+        if not meridiem and match.group(2) is None:
+            return None  # Bare hour ("6") is ambiguous between AM and PM
+        if meridiem:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if meridiem == "p" else 0)
+        if hour > 23 or minute > 59:
+            return None
+        return f"{hour:02d}{minute:02d}"
+
+    if param == "action":
+        match = _ACTION_RE.match(answer)
+        return _ACTION_KEYWORDS[match.group(1)] if match else None
+
+    return None
+
+
 # =============================================================================
 # Conditional Routing
 # =============================================================================
 
 
-def route_after_extraction(state: ShiftWorkflowState) -> Literal["validate", "clarify", "complete_no_action"]:
+def route_after_extraction(
+    state: ShiftWorkflowState
+) -> Literal["execute", "clarify", "complete_no_action", "end"]:
     """
-    Route after parameter extraction.
+    Route after parameter extraction (which includes validation).
 
     If no actions needed (empty parsed_requests), complete with warnings.
     If parameters are missing, ask for clarification.
-    Otherwise, proceed to validation.
+    If validation passed, execute the commands.
+    Otherwise, end (warnings will be sent by caller).
     """
     parsed_requests = state.get("parsed_requests", [])
     missing = state.get("missing_parameters", [])
@@ -570,21 +792,7 @@ def route_after_extraction(state: ShiftWorkflowState) -> Literal["validate", "cl
     elif missing:
         logger.info(f"→ Route to CLARIFY ({len(missing)} missing parameters)")
         return "clarify"
-    else:
-        logger.info("→ Route to VALIDATE")
-        return "validate"
-
-
-def route_after_validation(state: ShiftWorkflowState) -> Literal["execute", "end"]:
-    """
-    Route after validation.
-
-    If validation passed, execute the command.
-    Otherwise, end (warnings will be sent by caller).
-    """
-    passed = state.get("validation_passed", False)
-
-    if passed:
+    elif state.get("validation_passed", False):
         logger.info("→ Route to EXECUTE")
         return "execute"
     else:
@@ -602,11 +810,11 @@ def create_shift_workflow() -> StateGraph:
     Create and compile the shift coverage workflow.
 
     Workflow flow:
-    1. extract_parameters → (no actions?) → complete_no_action OR (has missing?) → clarify OR validate
+    1. extract_parameters (LLM extraction + validation) → (no actions?) → complete_no_action
+       OR (has missing?) → clarify OR (valid?) → execute OR end
     2. complete_no_action → END (no action needed)
     3. clarify → END (pause for user input)
-    4. validate → (passed?) → execute OR end
-    5. execute → END
+    4. execute → END
 
     Returns:
         Compiled LangGraph workflow
@@ -619,7 +827,6 @@ def create_shift_workflow() -> StateGraph:
     # Add nodes
     workflow.add_node("extract_parameters", extract_parameters_node)
     workflow.add_node("clarify", request_clarification_node)
-    workflow.add_node("validate", validate_parameters_node)
     workflow.add_node("execute", execute_command_node)
     workflow.add_node("complete_no_action", complete_no_action_node)
 
@@ -633,14 +840,6 @@ def create_shift_workflow() -> StateGraph:
         {
             "complete_no_action": "complete_no_action",
             "clarify": "clarify",
-            "validate": "validate"
-        }
-    )
-
-    workflow.add_conditional_edges(
-        "validate",
-        route_after_validation,
-        {
             "execute": "execute",
             "end": END
         }
@@ -657,3 +856,14 @@ def create_shift_workflow() -> StateGraph:
     logger.info("✅ Shift coverage workflow compiled")
 
     return compiled
+
+
+@functools.cache
+def get_shift_workflow():
+    """
+    Return the compiled shift coverage workflow, compiling it on first use.
+
+    The graph is static and compiled graphs are safe to share, so every
+    caller gets the same instance.
+    """
+    return create_shift_workflow()